@@ -1,6 +1,39 @@
+import importlib
+from typing import TYPE_CHECKING
+
 from .version import __version__  # noqa: F401
 
+if TYPE_CHECKING:
+    from . import main_window, overview, splash, utils  # noqa: F401
+    from .main_window import LucidMainWindow  # noqa: F401
+
 __all__ = ['LucidMainWindow', 'main_window', 'overview', 'utils', 'splash']
 
-from . import main_window, overview, splash, utils
-from .main_window import LucidMainWindow
+# Deferred (PEP 562) imports: resolving any of these names triggers the full
+# Qt/typhos/happi import chain, so hold off until something actually asks.
+_LAZY_ATTRS = {
+    'LucidMainWindow': ('lucid.main_window', 'LucidMainWindow'),
+    'main_window': ('lucid.main_window', None),
+    'overview': ('lucid.overview', None),
+    'splash': ('lucid.splash', None),
+    'utils': ('lucid.utils', None),
+    'launcher': ('lucid.launcher', None),
+}
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    module = importlib.import_module(module_name)
+    value = module if attr is None else getattr(module, attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
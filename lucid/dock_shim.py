@@ -4,17 +4,34 @@ the conda builds of PyQtAds.
 
 The pypi builds do not seem to have the same issue.
 """
-try:
-    # pre-v4.0.0
-    from PyQtAds import QtAds as ads
-except ImportError:
-    try:
-        # from v4.0.0 to v4.1.1
-        from PyQtAds import ads
-    except ImportError:
-        # starting at v4.2.0 (latest, for now)
-        import PyQtAds as ads
+import importlib
+import importlib.util
+
+_pkg = importlib.import_module("PyQtAds")
+
+
+def _get_submodule(name):
+    'The given PyQtAds submodule, or None if this build does not have it'
+    if hasattr(_pkg, name):
+        return getattr(_pkg, name)
+    # Package layouts may not bind the submodule in __init__; probe for it
+    # the way ``from PyQtAds import name`` would find it.  find_spec raises
+    # ModuleNotFoundError when _pkg is a plain extension module, hence the
+    # __path__ gate.
+    if (hasattr(_pkg, "__path__")
+            and importlib.util.find_spec(f"PyQtAds.{name}") is not None):
+        return importlib.import_module(f"PyQtAds.{name}")
+    return None
+
+
+# pre-v4.0.0
+ads = _get_submodule("QtAds")
+if ads is None:
+    # from v4.0.0 to v4.1.1
+    ads = _get_submodule("ads")
+if ads is None:
+    # starting at v4.2.0 (latest, for now)
+    ads = _pkg
 
 if not hasattr(ads, "CDockWidget"):
-    import PyQtAds
-    raise ImportError(f"Submodule name for PyQtAds changed (again): {dir(PyQtAds)}")
+    raise ImportError(f"Submodule name for PyQtAds changed (again): {dir(_pkg)}")
@@ -1,39 +1,51 @@
+import argparse
 import asyncio
-import collections
 import functools
+import importlib
+import importlib.util
 import logging
+import operator
+import os
 import pathlib
 import random
 import signal
-
-import happi  # noqa
-import pcdsutils.log
-import typhos
-import typhos.utils
-from ophyd.signal import EpicsSignalBase
-from pydm import exception
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# Note: qtpy must be imported at module scope for the HappiLoader class
+# definition below.  The heavier dependencies (happi, typhos, pydm,
+# pcdsutils, ophyd, PyQtAds and the lucid submodules that pull them in)
+# are deferred into the functions that use them so that ``lucid --help``
+# and ``--version`` do not pay their import cost.
 from qtpy import QtCore, QtWidgets
 
 import lucid
 
-from . import utils
-from .dock_shim import ads
-
 MODULE_PATH = pathlib.Path(__file__).parent
 
 logger = logging.getLogger(__name__)
 
+# (display, slug) stand and system names used for the DEMO beamline
+DEMO_STANDS = tuple(
+    (stand, stand.lower())
+    for stand in ('DIA', 'DG1', 'TFS', 'DG2', 'TAB', 'DET', 'DG3')
+)
+DEMO_SYSTEMS = tuple(
+    (system, system.lower().replace(' ', '_'))
+    for system in ('Timing', 'Beam Control', 'Diagnostics', 'Motion',
+                   'Vacuum')
+)
 
-def get_happi_entry_value(entry, key):
-    value = entry.metadata.get(key, None)
-    if not value:
-        raise ValueError(f'Invalid Key ({key} not in {entry}.')
-    return value
 
+@functools.lru_cache(maxsize=1)
+def _search_active():
+    'All active happi entries, memoized for the session'
+    cli = lucid.utils.get_happi_client()
+    return tuple(cli.search(active=True))
 
-def get_parser():
-    import argparse
 
+@functools.lru_cache(maxsize=1)
+def get_parser():
     from . import __version__
 
     proj_desc = "LUCID - LCLS User Control and Interface Design"
@@ -86,6 +98,13 @@ def get_parser():
         action='store_true',
         default=False
     )
+    parser.add_argument(
+        '--eager_connect',
+        help='Connect to every device signal at load time instead of '
+             'deferring connections until a screen needs them.',
+        action='store_true',
+        default=False
+    )
     return parser
 
 
@@ -94,36 +113,79 @@ def parse_arguments(*args, **kwargs):
     return parser.parse_args(*args, **kwargs)
 
 
-class HappiLoader(QtCore.QThread):
-    def __init__(self, *args, beamline, group_keys, callbacks, **kwargs):
+class _LoaderSignals(QtCore.QObject):
+    'Signal holder for the QRunnable-based loaders'
+    finished = QtCore.Signal(object)
+
+
+class HappiLoader(QtCore.QRunnable):
+    '''
+    Load devices on the global thread pool, reporting back with a single
+    queued ``finished`` signal carrying the device group dictionary.
+    '''
+    __slots__ = ('beamline', 'group_keys', 'eager_connect', 'signals')
+
+    def __init__(self, *, beamline, group_keys, callbacks=(),
+                 eager_connect=False):
+        super().__init__()
         self.beamline = beamline
         self.group_keys = group_keys
-        self.callbacks = callbacks
-        super().__init__(*args, **kwargs)
+        self.eager_connect = eager_connect
+        self.signals = _LoaderSignals()
+        for cb in callbacks:
+            self.signals.finished.connect(cb)
 
     def _load_from_happi(self, row_group_key, col_group_key):
         '''Fill with Data from Happi'''
-        cli = lucid.utils.get_happi_client()
-        results = []
-        for line in self.beamline:
-            results += cli.search(beamline=line, active=True)
+        import contextlib
+
+        import typhos.utils
 
-        dev_groups = collections.defaultdict(list)
+        beamlines = set(self.beamline)
+        results = [res for res in _search_active()
+                   if res.metadata.get('beamline') in beamlines]
+
+        dev_groups = {}
 
         if not len(results):
             raise ValueError(
                 f"Could not find entries for beamline {self.beamline}")
 
-        with typhos.utils.no_device_lazy_load():
-            for res in results:
-                try:
-                    stand = get_happi_entry_value(res, row_group_key)
-                    system = get_happi_entry_value(res, col_group_key)
-                    dev_obj = res.get(threaded=True)
-                    dev_groups[f"{stand}|{system}"].append(dev_obj)
-                except Exception:
-                    logger.exception('Failed to load device %s', res)
-                    continue
+        get_groups = operator.itemgetter(row_group_key, col_group_key)
+        to_load = []
+        for res in results:
+            try:
+                stand, system = get_groups(res.metadata)
+            except KeyError:
+                stand = system = None
+            # Empty/None group values are as unusable as missing ones
+            if not (stand and system):
+                logger.warning(
+                    'Entry %s missing %r or %r; skipping',
+                    res, row_group_key, col_group_key)
+                continue
+            to_load.append((res, f"{stand}|{system}"))
+
+        # Device instantiation is I/O-bound (channel access setup); fan it
+        # out across a thread pool rather than serializing N constructions.
+        # Signal connection is deferred unless --eager_connect was given.
+        if self.eager_connect:
+            lazy_ctx = typhos.utils.no_device_lazy_load()
+        else:
+            lazy_ctx = contextlib.nullcontext()
+        with lazy_ctx:
+            with ThreadPoolExecutor(
+                    max_workers=min(32, max(1, len(to_load)))) as pool:
+                futures = {pool.submit(res.get, threaded=True): (res, key)
+                           for res, key in to_load}
+                for future in as_completed(futures):
+                    res, key = futures[future]
+                    try:
+                        dev_obj = future.result()
+                    except Exception:
+                        logger.exception('Failed to load device %s', res)
+                        continue
+                    dev_groups.setdefault(key, []).append(dev_obj)
         return dev_groups
 
     def _load_demo(self):
@@ -132,21 +194,19 @@ class HappiLoader(QtCore.QThread):
 
         # Create an event loop in this thread for ophyd.sim
         asyncio.set_event_loop(asyncio.new_event_loop())
-        dev_groups = collections.defaultdict(list)
-
-        # Fill IndicatorGrid
-        for stand in ('DIA', 'DG1', 'TFS', 'DG2', 'TAB', 'DET', 'DG3'):
-            for system in ('Timing', 'Beam Control', 'Diagnostics',
-                           'Motion', 'Vacuum'):
-                # Create devices
-                device_count = random.randint(1, 12)
-                # device_count = 1
-                system_name = system.lower().replace(' ', '_')
-                devices = [
-                    SynAxis(name=f'{stand.lower()}_{system_name}_{i}')
-                    for i in range(device_count)]
-                dev_groups[f"{stand}|{system}"] = devices
-        return dev_groups
+
+        # Fill IndicatorGrid with 1-12 devices per (stand, system) cell;
+        # draw every cell count with a single RNG call.
+        counts = iter(random.choices(range(1, 13),
+                                     k=len(DEMO_STANDS) * len(DEMO_SYSTEMS)))
+        return {
+            f'{stand}|{system}': [
+                SynAxis(name=f'{stand_name}_{system_name}_{i}')
+                for i in range(next(counts))
+            ]
+            for stand, stand_name in DEMO_STANDS
+            for system, system_name in DEMO_SYSTEMS
+        }
 
     def run(self):
         exc = None
@@ -163,50 +223,98 @@ class HappiLoader(QtCore.QThread):
         except Exception as e:
             exc = e
 
-        # Call the callback using the Receiver Slot Thread
-        for cb in self.callbacks:
-            f = functools.partial(cb, devices=dev_groups)
-            QtCore.QTimer.singleShot(0, f)
+        # One queued signal fans out to every connected slot on the GUI
+        # thread - no per-callback timer events.
+        self.signals.finished.emit(dev_groups)
 
         # This will be grabbed by the uncaught exception handler
         if exc:
             raise exc
 
 
-class NoOpLoader(QtCore.QThread):
+class NoOpLoader(QtCore.QRunnable):
+    __slots__ = ('signals',)
+
+    def __init__(self):
+        super().__init__()
+        self.signals = _LoaderSignals()
+
     def run(self):
-        return
+        self.signals.finished.emit(None)
 
 
 def launch(beamline, *, toolbar=None, row_group_key="location_group",
            col_group_key="functional_group", log_level="INFO",
-           dark=False, skip_happi=False):
+           dark=False, skip_happi=False, eager_connect=False):
     # Re-enable sigint (usually blocked by pyqt)
     signal.signal(signal.SIGINT, signal.SIG_DFL)
 
-    # Silence the logger from pyPDB.dbd.yacc
-    logging.getLogger("pyPDB.dbd.yacc").setLevel(logging.WARNING)
-    logging.getLogger("ophyd").setLevel(logging.WARNING)
-
-    lucid_logger = logging.getLogger('')
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter(
-        '[%(asctime)s] [%(levelname)-8s] - %(message)s')
-    handler.setFormatter(formatter)
-    lucid_logger.addHandler(handler)
-    lucid_logger.setLevel(log_level)
-    handler.setLevel(log_level)
-    pcdsutils.log.PydmDemotionFilter.install(only_duplicates=False)
+    logging.basicConfig(
+        level=log_level,
+        format='[%(asctime)s] [%(levelname)-8s] - %(message)s',
+        datefmt='%H:%M:%S',
+        force=True,
+    )
+    # None of our formats use thread/process info; skip collecting it on
+    # every log record.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    # Skip Qt's subtractOpaqueSiblings pass when repainting; with the
+    # dock grid's many non-overlapping cells the per-repaint sibling
+    # geometry intersection is pure overhead.  Note: widgets that overlap
+    # opaque siblings would over-draw with this set, which LUCID avoids.
+    os.environ.setdefault("QT_NO_SUBTRACTOPAQUESIBLINGS", "1")
 
     app = QtWidgets.QApplication([])
     app.setOrganizationName("SLAC National Accelerator Laboratory")
     app.setOrganizationDomain("slac.stanford.edu")
     app.setApplicationName("LUCID")
 
-    typhos.use_stylesheet(dark=dark)
-
+    # Get the splash on screen first - everything heavier than
+    # lucid.splash itself waits until the user can see feedback.
     splash = lucid.splash.Splash()
     splash.show()
+    app.processEvents()
+
+    # Overlap the remaining heavy imports with the splash screen's first
+    # paint: the worker thread warms up sys.modules while the main thread
+    # keeps the event loop spinning.
+    heavy_imports = threading.Thread(
+        target=lambda: [
+            importlib.import_module(module)
+            for module in ('typhos', 'pydm.exception', 'happi',
+                           'pcdsutils.log', 'lucid.utils',
+                           'lucid.dock_shim', 'lucid.main_window',
+                           'lucid.overview')
+        ],
+        daemon=True,
+    )
+    heavy_imports.start()
+    while heavy_imports.is_alive():
+        app.processEvents()
+        heavy_imports.join(0.05)
+
+    import pcdsutils.log
+    import typhos
+    from pydm import exception
+
+    from . import utils
+    from .dock_shim import ads
+
+    # Silence chatty third-party loggers, where installed
+    if importlib.util.find_spec("pyPDB") is not None:
+        logging.getLogger("pyPDB.dbd.yacc").setLevel(logging.WARNING)
+    logging.getLogger("ophyd").setLevel(logging.WARNING)
+    pcdsutils.log.PydmDemotionFilter.install(only_duplicates=False)
+
+    def apply_typhos_stylesheet():
+        typhos.use_stylesheet(dark=dark)
+
+    # Defer the application-wide QSS parse until the event loop runs; it
+    # does not need to happen before the splash or the main window exist.
+    QtCore.QTimer.singleShot(0, apply_typhos_stylesheet)
 
     splash.update_status("Creating Main Window")
     window = lucid.main_window.LucidMainWindow(dark=dark)
@@ -225,6 +333,15 @@ def launch(beamline, *, toolbar=None, row_group_key="location_group",
 
     splash.update_status(f"Loading {beamline} devices")
 
+    from ophyd.signal import EpicsSignalBase
+
+    # TODO make configurable
+    timeout = 10
+    EpicsSignalBase.set_defaults(
+        timeout=timeout,
+        connection_timeout=timeout,
+    )
+
     # callback list for Happi Loader
     cbs = [grid.add_from_dict]
     if skip_happi:
@@ -232,7 +349,8 @@ def launch(beamline, *, toolbar=None, row_group_key="location_group",
     else:
         loader = HappiLoader(beamline=beamline,
                              group_keys=(row_group_key, col_group_key),
-                             callbacks=cbs)
+                             callbacks=cbs,
+                             eager_connect=eager_connect)
 
     def grid_to_dock():
         dock_widget = ads.CDockWidget('Grid')
@@ -248,26 +366,25 @@ def launch(beamline, *, toolbar=None, row_group_key="location_group",
 
         window.dock_manager.addDockWidget(ads.LeftDockWidgetArea,
                                           dock_widget)
+        window.invalidate_child_cache()
+
+    def loader_finished(devices):
+        splash.accept()
+        grid_to_dock()
+        window.show()
 
-    loader.finished.connect(splash.accept)
-    loader.finished.connect(grid_to_dock)
-    loader.finished.connect(window.show)
+    # Slots run in connection order: the grid is populated (via the
+    # callbacks connected above) before the window is shown.
+    loader.signals.finished.connect(loader_finished)
 
-    loader.start()
+    QtCore.QThreadPool.globalInstance().start(loader)
 
     app.exec_()
 
 
 def main():
     args = parse_arguments()
-    kwargs = vars(args)
-    # TODO make configurable
-    timeout = 10
-    EpicsSignalBase.set_defaults(
-        timeout=timeout,
-        connection_timeout=timeout,
-    )
-    launch(**kwargs)
+    launch(**vars(args))
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
+import collections
 import functools
 import logging
-import pathlib
+import re
+import threading
+from importlib.resources import files
 
 import typhos
 from pydm import exception
@@ -15,9 +18,26 @@ from .dock_shim import ads
 
 logger = logging.getLogger(__name__)
 
-MODULE_PATH = pathlib.Path(__file__).parent
 _ICONS = {}
 
+# Dock widgets that should never be gathered into the right dock area
+_GATHER_SKIP = frozenset(('Grid', 'Quick Launcher Toolbar'))
+
+# Dock shim attributes used on the docking hot path, bound once at import
+_CDockWidget = ads.CDockWidget
+_RIGHT_DOCK_AREA = ads.RightDockWidgetArea
+
+
+@functools.lru_cache(maxsize=2)
+def _load_dock_stylesheet(dark):
+    'Read, minify, and cache the dock manager stylesheet'
+    filename = 'dock_style_dark.css' if dark else 'dock_style.css'
+    sheet = files('lucid').joinpath(filename).read_text(encoding='utf-8')
+    # Give Qt's CSS parser fewer tokens to lex: drop comments and
+    # collapse runs of whitespace.  No behavioral change.
+    sheet = re.sub(r'/\*.*?\*/', '', sheet, flags=re.S)
+    return re.sub(r'\s+', ' ', sheet).strip()
+
 
 class LucidMainWindowMenu(QtWidgets.QMenuBar):
     settings_changed = Signal(dict)
@@ -44,6 +64,15 @@ class LucidMainWindowMenu(QtWidgets.QMenuBar):
 
         # Options
         self.options_menu = self.addMenu('&Options')
+        # The entries are created lazily on first open; only the settings
+        # defaults (used by the property accessors) exist up front
+        self.settings.setdefault('search_overlay', True)
+        self.options_menu.aboutToShow.connect(self._populate_options_menu)
+
+    def _populate_options_menu(self):
+        'Create the options menu entries on first open'
+        if self.actions:
+            return
         # - Search overlay
         self.add_checkable_action('Search &overlay', 'search_overlay')
 
@@ -61,18 +90,19 @@ class LucidMainWindowMenu(QtWidgets.QMenuBar):
             The default checked state
         '''
         action = QtWidgets.QAction(label)
-        self.actions[settings_key] = action
-
         action.setCheckable(True)
-        self.settings[settings_key] = default
-        action.setChecked(self.settings[settings_key])
-
-        def set_option(value):
-            logger.debug('Setting %r to %s', settings_key, value)
-            setattr(self, settings_key, value)
+        action.setChecked(self.settings.setdefault(settings_key, default))
 
-        action.toggled.connect(set_option)
+        action.toggled.connect(
+            functools.partial(self._set_option, settings_key))
         self.options_menu.addAction(action)
+        # Record the action only once fully wired, so a failure above
+        # cannot leave a half-built entry blocking menu repopulation
+        self.actions[settings_key] = action
+
+    def _set_option(self, settings_key, value):
+        logger.debug('Setting %r to %s', settings_key, value)
+        setattr(self, settings_key, value)
 
     def _settings_property(key):
         'Property factory which updates the settings dict + emits changes'
@@ -80,8 +110,13 @@ class LucidMainWindowMenu(QtWidgets.QMenuBar):
             return self.settings[key]
 
         def fset(self, value):
-            action = self.actions[key]
-            if value in (True, False):
+            if isinstance(value, str):
+                # QSettings (INI) round-trips booleans as 'true'/'false'
+                value = value == "true"
+
+            # The action may not exist yet if the menu was never opened
+            action = self.actions.get(key)
+            if action is not None and value in (True, False):
                 action.setChecked(value)
 
             old_value = self.settings.get(key, None)
@@ -89,8 +124,6 @@ class LucidMainWindowMenu(QtWidgets.QMenuBar):
             if old_value is None or value != old_value:
                 signal = getattr(self, f'{key}_changed', None)
                 if signal is not None:
-                    if isinstance(value, str):
-                        value = value == "true"
                     signal.emit(value)
                 self.settings_changed.emit(dict(self.settings))
 
@@ -124,6 +157,8 @@ class LucidMainWindow(QMainWindow):
             return
         self.dock_manager = None
         self.dark = dark
+        self._child_cache = {}
+        self._search_open_count = 0
         super().__init__(parent=parent)
         self.setup_ui()
         self.__initialized = True
@@ -140,9 +175,20 @@ class LucidMainWindow(QMainWindow):
         return cls.__instance
 
     def moveEvent(self, event):
-        self.window_moved.emit(event)
+        # window_moved only exists to keep search popups glued to the
+        # window; skip the emission entirely when none are open.
+        if self._search_open_count:
+            self.window_moved.emit(event)
         super().moveEvent(event)
 
+    def search_frame_shown(self):
+        'A search popup opened - start forwarding window move events'
+        self._search_open_count += 1
+
+    def search_frame_hidden(self):
+        'A search popup closed'
+        self._search_open_count = max(0, self._search_open_count - 1)
+
     def setup_ui(self):
         # Menu
         self.menu = LucidMainWindowMenu(self)
@@ -161,30 +207,73 @@ class LucidMainWindow(QMainWindow):
 
         # Use the dockmanager for the main window - it will set itself as the
         # central widget
+        if hasattr(ads.CDockManager, 'OpaqueSplitterResize'):
+            # Resize docks opaquely rather than via the translucent
+            # rubber-band overlay and its extra paint passes (flag must be
+            # set before the manager is created; older PyQtAds lacks it)
+            ads.CDockManager.setConfigFlag(
+                ads.CDockManager.OpaqueSplitterResize, True)
         self.dock_manager = ads.CDockManager(self)
-        if self.dark:
-            self.dock_manager.setStyleSheet(
-                open(MODULE_PATH / (
-                    'dock_style_dark.css' if self.dark else 'dock_style.css')).read())
-        else:
-            self.dock_manager.setStyleSheet(
-                open(MODULE_PATH / 'dock_style.css').read())
+        self.dock_manager.setStyleSheet(_load_dock_stylesheet(self.dark))
+
+    def cached_children(self, cls):
+        '''
+        ``findChildren(cls)``, cached until the widget hierarchy changes
+
+        The search machinery repeatedly scans for grids, displays, and
+        suites; walking the full widget tree each time is wasteful.  The
+        cache is invalidated whenever a dock is added or a cached child is
+        destroyed.
+
+        Parameters
+        ----------
+        cls : type
+            The QWidget subclass to search for
+        '''
+        try:
+            return self._child_cache[cls]
+        except KeyError:
+            # Everything the search cares about lives inside the dock
+            # manager; scan only that subtree once it exists.
+            root = self.dock_manager if self.dock_manager else self
+            children = root.findChildren(cls)
+            self._child_cache[cls] = children
+            for child in children:
+                child.destroyed.connect(self.invalidate_child_cache)
+            return children
+
+    def invalidate_child_cache(self, _obj=None):
+        'Drop the cached findChildren results'
+        self._child_cache.clear()
 
     def gather_windows(self):
         'Move all dock widgets to the right dock widget area'
-        name_to_dock_widget = self.dock_manager.dockWidgetsMap()
-        for name, dock_widget in name_to_dock_widget.items():
-            if name in ('Grid', 'Quick Launcher Toolbar'):
-                continue
-
-            if dock_widget.isFloating():
-                self.dock_manager.addDockWidget(ads.RightDockWidgetArea,
-                                                dock_widget)
-            elif dock_widget.isInFloatingContainer():
+        dock_widgets = [
+            dock_widget
+            for name, dock_widget in self.dock_manager.dockWidgetsMap().items()
+            if name not in _GATHER_SKIP
+        ]
+        gatherable = set(dock_widgets)
+        floating = [dock_widget for dock_widget in dock_widgets
+                    if dock_widget.isFloating()]
+        # Visit each floating container once - every dock inside it would
+        # otherwise re-report the container's full widget list
+        containers = []
+        for dock_widget in dock_widgets:
+            if (not dock_widget.isFloating()
+                    and dock_widget.isInFloatingContainer()):
                 container = dock_widget.dockContainer()
-                for dock_widget in container.dockWidgets():
-                    self.dock_manager.addDockWidget(ads.RightDockWidgetArea,
-                                                    dock_widget)
+                if container not in containers:
+                    containers.append(container)
+        # Membership in `gatherable` both applies the skip list and keeps
+        # each contained dock unique
+        contained = [contained_widget
+                     for container in containers
+                     for contained_widget in container.dockWidgets()
+                     if contained_widget in gatherable]
+        for dock_widget in (*floating, *contained):
+            self.dock_manager.addDockWidget(ads.RightDockWidgetArea,
+                                            dock_widget)
 
     @QtCore.Slot(tuple)
     def handle_error(self, exc_info):
@@ -211,18 +300,28 @@ class LucidMainWindow(QMainWindow):
         if not geometry.isEmpty():
             self.restoreGeometry(geometry)
 
-        for key in settings.allKeys():
+        # Only our own settings keys matter; don't enumerate the whole
+        # QSettings store to find them.
+        for key in self.menu.settings:
             value = settings.value(key, None)
-            if key in self.settings and value is not None:
+            if value is not None:
                 setattr(self.menu, key, value)
 
+        self._last_saved = (self.saveGeometry(), self.settings)
+
     def _save_settings(self):
+        state = (self.saveGeometry(), self.settings)
+        if state == getattr(self, '_last_saved', None):
+            # Nothing changed since the last save/restore; skip the write
+            return
+
         app = QtWidgets.QApplication.instance()
         settings = QtCore.QSettings(app.organizationName(),
                                     app.applicationName())
-        settings.setValue('geometry', self.saveGeometry())
-        for key, value in self.settings.items():
+        settings.setValue('geometry', state[0])
+        for key, value in state[1].items():
             settings.setValue(key, value)
+        self._last_saved = state
 
     def keyPressEvent(self, ev):
         'Keypress event callback from Qt'
@@ -243,12 +342,19 @@ class LucidMainWindow(QMainWindow):
         -------
         window: LucidMainWindow
         """
+        # The resolved window is memoized on the widget itself so repeated
+        # lookups are a single property read instead of a hierarchy walk
+        cached = widget.property('_lucid_main_window')
+        if cached is not None:
+            return cached
+
         parent = widget.parent()
-        if isinstance(parent, cls):
-            return parent
-        elif parent is None:
-            raise OSError("No LucidMainWindow can be found in widget hierarchy")
-        return cls.find_window(parent)
+        while parent is not None:
+            if isinstance(parent, cls):
+                widget.setProperty('_lucid_main_window', parent)
+                return parent
+            parent = parent.parent()
+        raise OSError("No LucidMainWindow can be found in widget hierarchy")
 
     def find_dock_widget_by_title(self, title):
         '''
@@ -299,17 +405,26 @@ class LucidMainWindow(QMainWindow):
             QtWidgets.QSizePolicy.Ignored
         )
 
-        dock = ads.CDockWidget(title)
-        dock.setMinimumSizeHintMode(
-            ads.CDockWidget.MinimumSizeHintFromContent
-        )
-        dock.setWidget(widget)
-        widget.setParent(dock)
-        self.dock_manager.addDockWidget(area, dock)
-
-        # Ensure the main dock is actually visible
-        widget.raise_()
-        widget.setVisible(True)
+        # Batch the dock insertion into a single layout/paint pass
+        self.setUpdatesEnabled(False)
+        try:
+            dock = _CDockWidget(title)
+            dock.setMinimumSizeHintMode(
+                _CDockWidget.MinimumSizeHintFromContent
+            )
+            dock.setWidget(widget)
+            widget.setParent(dock)
+            self.dock_manager.addDockWidget(area, dock)
+            self.invalidate_child_cache()
+
+            # Ensure the main dock is actually visible; raise after the
+            # pending layout events settle rather than forcing an extra
+            # sibling reorder/repaint now
+            widget.setVisible(True)
+            QtCore.QTimer.singleShot(0, widget.raise_)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
         return dock
 
     @classmethod
@@ -359,8 +474,10 @@ class LucidMainWindow(QMainWindow):
         """
         # When the decorator is not called
         if not func:
-            return functools.partial(cls.in_dock, area=area, title=title,
-                                     active_slot=active_slot)
+            def decorator(inner_func):
+                return cls.in_dock(inner_func, title=title, area=area,
+                                   active_slot=active_slot)
+            return decorator
 
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -375,43 +492,81 @@ class LucidMainWindow(QMainWindow):
 
             dock = LucidMainWindow().add_dock(
                 title=dock_title, widget=widget,
-                area=ads.RightDockWidgetArea)
+                area=_RIGHT_DOCK_AREA)
 
             if active_slot:
-                dock.viewToggled.connect(active_slot)
+                # Only connect on the dock's first appearance (as the
+                # docstring promises); re-invocations otherwise stack
+                # duplicate slots that all fire on every toggle.
+                if not dock.property('_lucid_active_slot_connected'):
+                    dock.viewToggled.connect(active_slot)
+                    dock.setProperty('_lucid_active_slot_connected', True)
                 active_slot(True)
             return widget
 
         return wrapper
 
 
-class _SearchThread(QtCore.QThread):
-    def __init__(self, func, callback, *, parent, kwargs):
-        super().__init__(parent)
+class _SearchRunnable(QtCore.QRunnable):
+    'Run a single search function on the global thread pool'
+
+    def __init__(self, func, callback, *, kwargs):
+        super().__init__()
         self.func = func
         self.callback = callback
         self.kwargs = kwargs
-        self.setTerminationEnabled(True)
-        self.start()
 
     def run(self):
         try:
             self.func(self.callback, **self.kwargs)
         except Exception:
-            logger.exception('Search thread failed! func=%s',
-                             self.func.__name__)
+            logger.exception('Search failed! func=%s', self.func.__name__)
+
+
+# Fuzzy matching is pure string work and search passes re-score the same
+# (name, query) pairs constantly; memoize across all of them.
+_fuzzy_match = functools.lru_cache(maxsize=8192)(utils.fuzzy_match)
+
+
+@functools.lru_cache(maxsize=256)
+def _query_prefilter(text):
+    '''
+    Compiled regex that cheaply rejects names unrelated to ``text``
+
+    Matches the first three characters of each query token of length >= 3
+    against the underscore-stripped lowercase name.  Tokens are
+    underscore-stripped the same way, so queries like ``v_mot`` still
+    match.  Returns None when the query has no usable tokens
+    (prefiltering would be meaningless).
+    '''
+    tokens = [re.escape(token[:3])
+              for token in (raw.replace('_', '')
+                            for raw in text.lower().split())
+              if len(token) >= 3]
+    if not tokens:
+        return None
+    return re.compile('|'.join(tokens))
 
 
 def _cell_match(cell, text_list, threshold=50):
-    ratio = [(utils.fuzzy_match(name, text, threshold=threshold), name)
-             for name in cell.matchable_names
-             for text in text_list
-             ]
-    if ratio:
-        ratio.sort()
-        return ratio[-1]
+    'Best (ratio, name) fuzzy match of the cell against the query texts'
+    best = (0.0, '')
+    for text in text_list:
+        prefilter = _query_prefilter(text)
+        for name in cell.matchable_names:
+            if (prefilter is not None and
+                    not prefilter.search(name.lower().replace('_', ''))):
+                # No token prefix appears anywhere in the name - not
+                # worth the full fuzzy scoring pass
+                continue
+            ratio = _fuzzy_match(name, text, threshold=threshold)
+            if ratio >= 100:
+                # A perfect match cannot be beaten
+                return ratio, name
+            if (ratio, name) > best:
+                best = (ratio, name)
 
-    return 0.0, ''
+    return best
 
 
 def _thread_grid_search(callback, *, general_search, category_search,
@@ -421,25 +576,18 @@ def _thread_grid_search(callback, *, general_search, category_search,
         return
 
     main = LucidMainWindow.get_instance()
-    for grid in main.findChildren(lucid.overview.IndicatorGrid):
-        for group_name, group in grid.groups.items():
-            if group.orientation == 'row':
-                # Only iterate over vertical-column groups
-                continue
-            for cell in group.cells:
-                if len(cell.devices) == 0:
-                    continue
-                ratio, match = _cell_match(cell, general_search,
-                                           threshold=threshold)
-                if ratio > threshold:
-                    callback(
-                        source='grid',
-                        rank=ratio,
-                        name=cell.title,
-                        item=cell,
-                        reason=match,
-                        callback=cell.click,
-                    )
+    for grid in main.cached_children(lucid.overview.IndicatorGrid):
+        for cell in grid.search_cells():
+            ratio, match = _cell_match(cell, general_search,
+                                       threshold=threshold)
+            if ratio > threshold:
+                callback(
+                    source='grid',
+                    rank=ratio,
+                    name=cell.title,
+                    item=cell,
+                    reason=match,
+                )
 
 
 def _raise_display(display):
@@ -455,9 +603,9 @@ def _thread_screens_search(callback, *, general_search, category_search,
         return
 
     main = LucidMainWindow.get_instance()
-    for display in main.findChildren(typhos.TyphosDeviceDisplay):
-        ratio = max(utils.fuzzy_match(display.device_name, text,
-                                      threshold=threshold)
+    for display in main.cached_children(typhos.TyphosDeviceDisplay):
+        ratio = max(_fuzzy_match(display.device_name, text,
+                                 threshold=threshold)
                     for text in general_search)
         if ratio > threshold:
             callback(
@@ -466,16 +614,15 @@ def _thread_screens_search(callback, *, general_search, category_search,
                 name=display.device_name,
                 item=display,
                 reason='device',
-                callback=lambda disp=display: _raise_display(disp),
             )
 
-    for suite in main.findChildren(typhos.TyphosSuite):
+    for suite in main.cached_children(typhos.TyphosSuite):
         suite_parent = suite.parent()
         if not hasattr(suite_parent, 'title'):
             continue
 
-        ratio = max(utils.fuzzy_match(suite_parent.title, text,
-                                      threshold=threshold)
+        ratio = max(_fuzzy_match(suite_parent.title, text,
+                                 threshold=threshold)
                     for text in general_search)
         if ratio > threshold:
             callback(
@@ -484,7 +631,6 @@ def _thread_screens_search(callback, *, general_search, category_search,
                 name=suite_parent.title,
                 item=suite,
                 reason='suite',
-                callback=lambda disp=suite: _raise_display(disp),
             )
 
 
@@ -502,21 +648,24 @@ def _happi_searchresult_to_display(search_result):
 def _thread_happi_search(callback, *, general_search, category_search,
                          threshold):
     'Search happi for the given text, running callback on each result'
+    # Hoist the per-iteration invariants out of the (item, text, key) loops
+    fuzzy = _fuzzy_match
+    general_keys = utils.HAPPI_GENERAL_SEARCH_KEYS
+
     for item in utils.get_happi_device_cache():
+        metadata = item.metadata
         item_results = []
         for key, text in category_search:
-            value = item.metadata.get(key)
+            value = metadata.get(key)
             if value is not None:
-                ratio = utils.fuzzy_match(text, str(value),
-                                          threshold=threshold)
+                ratio = fuzzy(text, str(value), threshold=threshold)
                 item_results.append((ratio, key, value))
 
         for text in general_search:
-            for key in utils.HAPPI_GENERAL_SEARCH_KEYS:
-                value = item.metadata.get(key)
+            for key in general_keys:
+                value = metadata.get(key)
                 if value is not None:
-                    ratio = utils.fuzzy_match(text, str(value),
-                                              threshold=threshold)
+                    ratio = fuzzy(text, str(value), threshold=threshold)
                     item_results.append((ratio, key, value))
 
         if not item_results:
@@ -531,7 +680,6 @@ def _thread_happi_search(callback, *, general_search, category_search,
                 name=item['name'],
                 item=item,
                 reason=f'{key}: {value}',
-                callback=lambda ct=item: _happi_searchresult_to_display(ct),
             )
 
 
@@ -544,9 +692,9 @@ def _stringify_dict(d, skip_keys, prefix=' -', delim='\n'):
 def _generate_icon(key):
     'Generate a simple icon based on the first letter of the `source` key'
     size = 128
-    main = LucidMainWindow.get_instance()
-    dpr = main.devicePixelRatioF()
-
+    # Render once at 2x and let Qt scale down; this keeps the cached icon
+    # independent of whichever screen the main window happens to be on.
+    dpr = 2
     pixmap = QtGui.QPixmap(size * dpr, size * dpr)
     pixmap.setDevicePixelRatio(dpr)
     pixmap.fill(Qt.transparent)
@@ -599,6 +747,7 @@ class SearchModelItem(QtGui.QStandardItem):
         self.item = item
         self.name = name
         self.reason = reason
+        self._tooltip = None
 
         if len(reason) > 40:
             reason = reason[:40] + '...'
@@ -606,33 +755,57 @@ class SearchModelItem(QtGui.QStandardItem):
 
         super().__init__(text)
 
-        tooltip = '\n'.join(
-            (reason,
-             '------------',
-             str(_stringify_dict(item, skip_keys=())
-                 if isinstance(item, dict) else item),
-             '',
-             _stringify_dict(info, skip_keys=('item', 'callback')),
-             )
-        )
-
         self.rank = rank
         self.setIcon(get_search_icon_by_source(info['source']))
         self.setData(self.rank, Qt.UserRole)
-        self.setData(tooltip, Qt.ToolTipRole)
         self.setEditable(False)
 
+    def data(self, role=Qt.UserRole + 1):
+        # Most results are never hovered; assemble the verbose tooltip
+        # only when Qt actually asks for it.
+        if role == Qt.ToolTipRole:
+            return self._build_tooltip()
+        return super().data(role)
+
+    def _build_tooltip(self):
+        if self._tooltip is None:
+            self._tooltip = '\n'.join(
+                (self.reason,
+                 '------------',
+                 str(_stringify_dict(self.item, skip_keys=())
+                     if isinstance(self.item, dict) else self.item),
+                 '',
+                 _stringify_dict(self.info, skip_keys=('item', 'callback')),
+                 )
+            )
+        return self._tooltip
+
     def run_callback(self):
+        # An explicit callback wins; otherwise dispatch on the source,
+        # avoiding a closure per search result.
         callback = self.info.get('callback')
-        if callback is None:
-            logger.debug('No callback for %s', self)
+        if callback is not None:
+            callback()
             return
 
-        callback()
+        source = self.info.get('source')
+        if source == 'grid':
+            self.item.click()
+        elif source == 'screens':
+            _raise_display(self.item)
+        elif source == 'happi':
+            _happi_searchresult_to_display(self.item)
+        else:
+            logger.debug('No callback for %s', self)
 
 
 class SearchModel(QtGui.QStandardItemModel):
     new_result = Signal(dict)
+    flush_started = Signal()
+    flush_finished = Signal()
+
+    # Delay before pending results are flushed into the model
+    _flush_ms = 50
 
     def __init__(self, text, *, search_happi=True, search_grid=True,
                  search_screens=True, threshold=60):
@@ -641,21 +814,32 @@ class SearchModel(QtGui.QStandardItemModel):
         category_search, general_search = utils.split_search_pattern(text)
         self.new_result.connect(self.add_result)
 
+        # Buffer incoming results and insert them in batches so the view
+        # re-sorts once per flush instead of once per result.
+        self._pending = []
+        self._flush_timer = QtCore.QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self._flush_ms)
+        self._flush_timer.timeout.connect(self._flush_pending)
+
+        self._cancelled = threading.Event()
+
         def new_result(**kw):
-            self.new_result.emit(kw)
+            if not self._cancelled.is_set():
+                self.new_result.emit(kw)
 
         self._callback_results = set()
-        self.search_threads = [
-            _SearchThread(func, new_result, parent=self,
-                          kwargs=dict(category_search=category_search,
-                                      general_search=general_search,
-                                      threshold=threshold,))
-            for category, func, enabled
-            in [('happi', _thread_happi_search, search_happi),
+        pool = QtCore.QThreadPool.globalInstance()
+        for category, func, enabled in [
+                ('happi', _thread_happi_search, search_happi),
                 ('grid', _thread_grid_search, search_grid),
-                ('screens', _thread_screens_search, search_screens)]
-            if enabled
-        ]
+                ('screens', _thread_screens_search, search_screens)]:
+            if enabled:
+                pool.start(_SearchRunnable(
+                    func, new_result,
+                    kwargs=dict(category_search=category_search,
+                                general_search=general_search,
+                                threshold=threshold,)))
 
     def add_result(self, info):
         key = (info['name'], info['source'], info['reason'])
@@ -663,10 +847,26 @@ class SearchModel(QtGui.QStandardItemModel):
             return
         self._callback_results.add(key)
 
-        self.appendRow(SearchModelItem(**info))
+        self._pending.append(info)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def _flush_pending(self):
+        'Insert all buffered results into the model at once'
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+
+        self.flush_started.emit()
+        try:
+            for info in pending:
+                self.appendRow(SearchModelItem(**info))
+        finally:
+            self.flush_finished.emit()
 
     def cancel(self):
-        ...
+        'Stop accepting results from any in-flight searches'
+        self._cancelled.set()
 
 
 class SearchDialog(QtWidgets.QDialog):
@@ -698,7 +898,8 @@ class SearchDialog(QtWidgets.QDialog):
         # [option frame]
         layout = QtWidgets.QVBoxLayout()
         self.match_list = SearchMatchList(self)
-        self.models = {}  # TODO: FIFO bounded dict
+        # Recently-used search models, least-recent first
+        self.models = collections.OrderedDict()
 
         self.setLayout(layout)
         layout.addWidget(self.match_list)
@@ -726,40 +927,63 @@ class SearchDialog(QtWidgets.QDialog):
         for w in (self.option_grid, self.option_screens, self.option_happi):
             option_layout.addWidget(w)
             w.setChecked(True)
-            w.stateChanged.connect(
-                lambda state: self._search_settings_changed()
-            )
+            w.stateChanged.connect(self._search_settings_changed)
 
         option_layout.addWidget(self.refresh_button)
-
-        def refresh_clicked():
-            self.search(self.text, force_update=True)
-
-        self.refresh_button.clicked.connect(refresh_clicked)
+        self.refresh_button.clicked.connect(self._refresh_clicked)
 
     @property
     def text(self):
         'The search text from the parent (SearchLineEdit)'
         return self.parent().text()
 
-    def _search_settings_changed(self):
+    def _search_settings_changed(self, _state=None):
         'Grid/screens/happi/etc parameters changed -> search again'
         self.search(self.text)
 
+    def _refresh_clicked(self, _checked=False):
+        'Refresh button clicked - search again, ignoring cached results'
+        self.search(self.text, force_update=True)
+
+    def _bulk_insert_started(self):
+        'Suspend proxy re-sorting while a batch of results is inserted'
+        self.proxy_model.setDynamicSortFilter(False)
+
+    def _bulk_insert_finished(self):
+        'Batch insert done - sort once and re-enable dynamic sorting'
+        self.proxy_model.setDynamicSortFilter(True)
+        self.proxy_model.sort(0, Qt.DescendingOrder)
+
+    # Maximum number of cached search models kept around
+    max_cached_models = 32
+
     def search(self, text, *, force_update=False):
         'Spawn a search for the given text, optionally clearing cached results'
         key = (text, self.option_happi.isChecked(),
                self.option_grid.isChecked(), self.option_screens.isChecked())
 
-        if key not in self.models or force_update:
+        model = self.models.get(key)
+        if model is None or force_update:
+            if model is not None:
+                model.cancel()
+                model.deleteLater()
             model = SearchModel(text,
                                 search_happi=self.option_happi.isChecked(),
                                 search_grid=self.option_grid.isChecked(),
                                 search_screens=self.option_screens.isChecked()
                                 )
+            model.flush_started.connect(self._bulk_insert_started)
+            model.flush_finished.connect(self._bulk_insert_finished)
             self.models[key] = model
 
-        self.proxy_model.setSourceModel(self.models[key])
+        # Keep the cache bounded, evicting the least-recently-used models
+        self.models.move_to_end(key)
+        while len(self.models) > self.max_cached_models:
+            _, old_model = self.models.popitem(last=False)
+            old_model.cancel()
+            old_model.deleteLater()
+
+        self.proxy_model.setSourceModel(model)
 
     def _handle_search_keypress(self, event):
         'Forward SearchLineEdit keypresses to the match list'
@@ -808,6 +1032,9 @@ class SearchMatchList(QtWidgets.QListView):
 class SearchLineEdit(QtWidgets.QLineEdit):
     key_pressed = Signal(QtGui.QKeyEvent)
 
+    # Delay after the last keystroke before a search is started
+    debounce_ms = 150
+
     def __init__(self, *, main_window, parent=None):
         super().__init__(parent=parent)
 
@@ -816,22 +1043,33 @@ class SearchLineEdit(QtWidgets.QLineEdit):
         self.setPlaceholderText("Search...")
         self.setClearButtonEnabled(True)
 
-        def text_changed(text):
-            # TODO: rate limit and/or show only after a short delay
-            if len(text.strip()) > 1:
-                self.show_search()
+        # Debounce keystrokes: restart the timer on every edit and only
+        # search once the user pauses, rather than on each character.
+        self._debounce = QtCore.QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.debounce_ms)
+        self._debounce.timeout.connect(self._search_debounced)
 
-        self.textChanged.connect(text_changed)
-        self.textChanged.connect(self.highlight_matches)
-
-        def clear_highlight():
-            if self.hasFocus():
-                self.setText('')
-            self.clear_highlight()
+        self.textChanged.connect(
+            lambda _text: self._debounce.start()
+        )
 
-        self.main.escape_pressed.connect(clear_highlight)
+        self.main.escape_pressed.connect(self._escape_pressed)
         self.main.window_moved.connect(self._reposition_search_frame)
 
+    def _escape_pressed(self):
+        'Escape pressed in the main window - clear the search'
+        if self.hasFocus():
+            self.setText('')
+        self.clear_highlight()
+
+    def _search_debounced(self):
+        'The user paused typing - run the search and update the overlay'
+        text = self.text()
+        if len(text.strip()) > 1:
+            self.show_search()
+        self.highlight_matches(text)
+
     def focusOutEvent(self, event):
         'Search box lost keyboard focus'
         if self.search_frame and self.search_frame.isVisible():
@@ -868,6 +1106,9 @@ class SearchLineEdit(QtWidgets.QLineEdit):
             self.search_frame = SearchDialog(parent=self,
                                              main_window=self.main)
 
+        if not self.search_frame.isVisible():
+            self.main.search_frame_shown()
+
         self._reposition_search_frame(
             width=max((20 * self.height(), self.width())),
             height=10 * self.height()
@@ -882,7 +1123,7 @@ class SearchLineEdit(QtWidgets.QLineEdit):
         'Are any overlays visible?'
         return any(
             grid.overlay.visible()
-            for grid in self.main.findChildren(lucid.overview.IndicatorGrid)
+            for grid in self.main.cached_children(lucid.overview.IndicatorGrid)
         )
 
     def highlight_matches(self, text):
@@ -898,53 +1139,63 @@ class SearchLineEdit(QtWidgets.QLineEdit):
 
         _, general_search = utils.split_search_pattern(text)
 
-        for grid in self.main.findChildren(lucid.overview.IndicatorGrid):
+        # Repaints are expensive; ignore sub-percent ratio jitter unless a
+        # cell crosses into (or out of) having any match at all.
+        epsilon = 0.01
+
+        for grid in self.main.cached_children(lucid.overview.IndicatorGrid):
             updated = False
-            min_ratio = 0.0
-            for group_name, group in grid.groups.items():
-                if group.orientation == 'row':
-                    # Only iterate over vertical-column groups
-                    continue
-                for cell in group.cells:
-                    if len(cell.devices) == 0:
-                        continue
-                    old_ratio = grid.overlay.cell_to_percentage.get(cell, 0.0)
-                    new_ratio, matched = _cell_match(cell, general_search)
-                    new_ratio /= 100.
-                    if old_ratio != new_ratio:
-                        grid.overlay.cell_to_percentage[cell] = new_ratio
-                        updated = True
-
-                    min_ratio = max((min_ratio, new_ratio))
-
-            grid.overlay.setVisible(True)
+            max_ratio = 0.0
+            for cell in grid.search_cells():
+                old_ratio = grid.overlay.cell_to_percentage.get(cell, 0.0)
+                new_ratio, matched = _cell_match(cell, general_search)
+                new_ratio /= 100.
+                if (abs(new_ratio - old_ratio) >= epsilon
+                        or bool(new_ratio) != bool(old_ratio)):
+                    grid.overlay.cell_to_percentage[cell] = new_ratio
+                    updated = True
+
+                max_ratio = max((max_ratio, new_ratio))
+
+            grid.overlay.setVisible(max_ratio > 0.0)
 
             if updated:
-                grid.overlay.repaint()
+                # update() lets Qt coalesce the overlay paints into one
+                # frame instead of forcing a synchronous repaint per grid
+                grid.overlay.update()
 
     def clear_highlight(self):
         'Hide the highlighting overlay'
-        for grid in self.main.findChildren(lucid.overview.IndicatorGrid):
+        for grid in self.main.cached_children(lucid.overview.IndicatorGrid):
             grid.overlay.setVisible(False)
 
         if self.search_frame is not None:
             self.search_frame.cancel()
+            if self.search_frame.isVisible():
+                self.main.search_frame_hidden()
             self.search_frame.setVisible(False)
 
 
 class LucidToolBar(QtWidgets.QToolBar):
     """LucidToolBar for LucidMainWindow"""
 
+    # Standard icons, rasterized once and shared by all toolbars
+    _back_icon = None
+    _forward_icon = None
+
     def __init__(self, parent=None):
         super().__init__(parent=parent)
         # Toolbar Configuration
         self.setMovable(False)
         self.setLayoutDirection(Qt.LeftToRight)
         # Back and Forward
-        self.addAction(self.style().standardIcon(QStyle.SP_ArrowLeft),
-                       'Back')
-        self.addAction(self.style().standardIcon(QStyle.SP_ArrowRight),
-                       'Forward')
+        cls = type(self)
+        if cls._back_icon is None:
+            style = self.style()
+            cls._back_icon = style.standardIcon(QStyle.SP_ArrowLeft)
+            cls._forward_icon = style.standardIcon(QStyle.SP_ArrowRight)
+        self.addAction(cls._back_icon, 'Back')
+        self.addAction(cls._forward_icon, 'Forward')
         self.addSeparator()
         # Spacer
         spacer = QtWidgets.QWidget()
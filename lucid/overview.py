@@ -1,5 +1,4 @@
 """Overview of the Experimental Area"""
-import collections
 import logging
 import os
 import weakref
@@ -126,11 +125,15 @@ class IndicatorCell(BaseDeviceButton):
         self._selecting_widgets = list()
         self.installEventFilter(self)
         self.devices = list()
+        self._matchable_names = None
 
     @property
     def matchable_names(self):
-        """All names used for text searching"""
-        return [self.title] + [device.name for device in self.devices]
+        """All names used for text searching, cached until devices change"""
+        if self._matchable_names is None:
+            self._matchable_names = (
+                self.title, *(device.name for device in self.devices))
+        return self._matchable_names
 
     @Property(bool)
     def selected(self):
@@ -147,6 +150,7 @@ class IndicatorCell(BaseDeviceButton):
         """Add a device to the IndicatorCell"""
         indicator = indicator_for_device(device)
         self.devices.append(device)
+        self._matchable_names = None
         self.add_indicator(indicator)
 
     def sizeHint(self):
@@ -217,6 +221,7 @@ class IndicatorGrid(QWidget):
         self.layout().setSpacing(0)
         self.layout().setSizeConstraint(QGridLayout.SetFixedSize)
         self._groups = dict()
+        self._search_cells = None
         self.setStyleSheet(
             '''\
 QWidget[selected="true"] {background-color: rgba(20, 140, 210, 150);}
@@ -227,6 +232,24 @@ QWidget[selected="true"] {background-color: rgba(20, 140, 210, 150);}
         'A dictionary of name to IndicatorGroup'
         return dict(self._groups)
 
+    def search_cells(self):
+        '''
+        Flat tuple of the cells relevant to searching, cached
+
+        Only cells with devices are included, and each cell appears once
+        (via its column group).  The cache is rebuilt after the grid
+        changes.
+        '''
+        if self._search_cells is None:
+            self._search_cells = tuple(
+                cell
+                for group in self._groups.values()
+                if group.orientation == 'column'
+                for cell in group.cells
+                if cell.devices
+            )
+        return self._search_cells
+
     def add_devices(self, devices, system=None, stand=None):
         # Create cell
         cell = IndicatorCell(title=f'{stand} {system}')
@@ -248,6 +271,7 @@ QWidget[selected="true"] {background-color: rgba(20, 140, 210, 150);}
         # Add cell to correct location in grid
         if cell:
             self.layout().addWidget(cell, *coords, Qt.AlignTop)
+        self._search_cells = None
 
     def _add_group(self, group, as_row):
         # Add to layout
@@ -361,37 +385,52 @@ class IndicatorGridWithOverlay(IndicatorGrid):
         self.frame.layout().addWidget(self)
 
         if toolbar_file is not None:
-            vertical_spacer = QtWidgets.QSpacerItem(
-                10, 20, QtWidgets.QSizePolicy.Minimum,
-                QtWidgets.QSizePolicy.MinimumExpanding
-            )
-            self.frame.layout().addItem(vertical_spacer)
-
-            quick_toolbar = lucid.overview.QuickAccessToolbar(self.frame)
-            quick_toolbar.toolsFile = toolbar_file
-            self.frame.layout().addWidget(quick_toolbar)
+            # Defer toolbar construction (and its YAML parse) until the
+            # event loop is running, keeping it off the splash-screen
+            # critical path.
+            QtCore.QTimer.singleShot(
+                0, partial(self._add_quick_toolbar, toolbar_file))
         self.overlay = IndicatorOverlay(self.frame, self)
         self.overlay.setVisible(False)
         self.stackUnder(self.overlay)
 
+    def _add_quick_toolbar(self, toolbar_file):
+        vertical_spacer = QtWidgets.QSpacerItem(
+            10, 20, QtWidgets.QSizePolicy.Minimum,
+            QtWidgets.QSizePolicy.MinimumExpanding
+        )
+        self.frame.layout().addItem(vertical_spacer)
+
+        quick_toolbar = QuickAccessToolbar(self.frame)
+        quick_toolbar.toolsFile = toolbar_file
+        self.frame.layout().addWidget(quick_toolbar)
+
+    # Number of cells added per event-loop pass while populating the grid
+    _chunk_size = 16
+
     def add_from_dict(self, devices=None):
-        rows = set()
-        cols = set()
         if devices is None:
             return
+        rows = set()
+        cols = set()
         for e in devices:
             r, c = e.split('|')
             rows.add(r)
             cols.add(c)
 
-        data = collections.OrderedDict()
-        for r in sorted(rows):
-            for c in sorted(cols):
-                data[f"{r}|{c}"] = devices.get(f"{r}|{c}") or []
+        cells = [(r, c, devices.get(f"{r}|{c}") or [])
+                 for r in sorted(rows)
+                 for c in sorted(cols)]
+        self._add_cell_chunk(cells)
 
-        for location, dev_list in data.items():
-            stand, system = location.split("|")
+    def _add_cell_chunk(self, cells):
+        """Add a batch of cells, deferring the rest to the event loop"""
+        for stand, system, dev_list in cells[:self._chunk_size]:
             self.add_devices(dev_list, stand=stand, system=system)
+        remaining = cells[self._chunk_size:]
+        if remaining:
+            QtCore.QTimer.singleShot(
+                0, partial(self._add_cell_chunk, remaining))
 
 
 class QuickAccessToolbar(QtWidgets.QWidget):
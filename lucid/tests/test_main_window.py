@@ -95,3 +95,18 @@ def test_main_window_raise(main_window, qtbot,
     # TODO
     # if not finish_floating:
     #     assert main_window.tabifiedDockWidgets(dock2) == [dock1]
+
+
+def test_main_window_settings_restore_roundtrip(main_window, qtbot):
+    menu = main_window.menu
+    # QSettings (INI) round-trips booleans as 'true'/'false' strings;
+    # restoring must coerce them back to bool
+    menu.search_overlay = 'false'
+    assert menu.settings['search_overlay'] is False
+    # The lazily-populated options menu must build from the coerced value
+    menu._populate_options_menu()
+    action = menu.actions['search_overlay']
+    assert not action.isChecked()
+    menu.search_overlay = 'true'
+    assert menu.settings['search_overlay'] is True
+    assert action.isChecked()
@@ -7,7 +7,6 @@ import socket
 import time
 import uuid
 
-import fuzzywuzzy.fuzz
 import happi
 import pcdsutils.log
 from pydm.widgets import PyDMDrawingCircle
@@ -22,6 +21,12 @@ except ImportError:
     # Compatibility with older versions of typhos
     TyphosAlarmCircle = None
 
+try:
+    # rapidfuzz's C++ ratio is a drop-in, much faster replacement
+    from rapidfuzz.fuzz import ratio as _fuzz_ratio
+except ImportError:
+    from fuzzywuzzy.fuzz import ratio as _fuzz_ratio
+
 
 logger = logging.getLogger(__name__)
 
@@ -145,7 +150,7 @@ def fuzzy_match(a, b, *, case_insensitive=True, threshold=50):
         a = a.lower()
         b = b.lower()
 
-    ratio = fuzzywuzzy.fuzz.ratio(a, b)
+    ratio = _fuzz_ratio(a, b)
     if ratio >= threshold:
         return ratio
 